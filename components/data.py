@@ -1,3 +1,6 @@
+import functools
+import os
+import tempfile
 import pandas as pd
 import streamlit as st
 import numpy as np
@@ -27,17 +30,696 @@ US_STATE_ABBREV = {
 }
 
 
-@st.cache_data
+DAYS_ORDER = ['Monday', 'Tuesday', 'Wednesday',
+              'Thursday', 'Friday', 'Saturday', 'Sunday']
+MONTHS_ORDER = ['January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December']
+
+# money fits float32 at this scale and the counters are single digits;
+# narrower columns halve the bytes every groupby and mask has to move
+NUMERIC_DTYPES = {
+    'sales_per_order': 'float32',
+    'profit_per_order': 'float32',
+    'order_item_discount': 'float32',
+    'order_quantity': 'int8',
+    'days_for_shipment_real': 'int8'
+}
+CATEGORICAL_COLUMNS = [
+    'customer_region', 'category_name', 'customer_segment',
+    'delivery_status', 'shipping_type', 'customer_state'
+]
+# high-cardinality text stays Arrow-backed instead of python objects,
+# which is only the default from pandas 3 onwards
+TEXT_COLUMNS = ['product_name', 'customer_city', 'order_id']
+# only the columns some chart reads are parsed; customer names, ids, country,
+# ship date and scheduled days never leave the CSV
+LOADED_COLUMNS = ['order_date', *NUMERIC_DTYPES,
+                  *CATEGORICAL_COLUMNS, *TEXT_COLUMNS]
+# every filter combination (and every date range) adds cache entries, so
+# the per-filter caches are bounded for long-running servers
+CACHE_MAX_ENTRIES = 200
+CACHE_TTL = 3600
+cached_aggregation = st.cache_data(
+    show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+
+
+def matches_schema(df: pd.DataFrame) -> bool:
+    # a cached copy is only reusable if it holds exactly the columns and
+    # dtypes the CSV read below would produce
+    if sorted(df.columns) != sorted(LOADED_COLUMNS):
+        return False
+    return (pd.api.types.is_datetime64_dtype(df['order_date'])
+            and all(str(df[col].dtype) == dtype
+                    for col, dtype in NUMERIC_DTYPES.items())
+            and all(isinstance(df[col].dtype, pd.CategoricalDtype)
+                    for col in CATEGORICAL_COLUMNS)
+            and all(df[col].dtype == 'string[pyarrow]' for col in TEXT_COLUMNS))
+
+
+def read_source(csv_file: str) -> pd.DataFrame:
+    # a typed Parquet copy next to the CSV skips text parsing on cold starts;
+    # it is rebuilt whenever the CSV is newer or the schema changes
+    parquet_file = os.path.splitext(csv_file)[0] + '.parquet'
+    if (os.path.exists(parquet_file)
+            and os.path.getmtime(parquet_file) >= os.path.getmtime(csv_file)):
+        try:
+            df = pd.read_parquet(parquet_file, engine='pyarrow')
+        except (OSError, ValueError):
+            # unreadable copy (e.g. left by a crashed writer): rebuild it
+            df = None
+        if df is not None and matches_schema(df):
+            return df
+
+    # low-cardinality strings are read straight into categoricals so
+    # filtering and grouping work on integer codes; the pyarrow engine
+    # parses multithreaded and converts the dates while reading
+    df = pd.read_csv(csv_file, encoding="cp1252", engine="pyarrow",
+                     usecols=LOADED_COLUMNS,
+                     dtype={**NUMERIC_DTYPES,
+                            **{col: 'category' for col in CATEGORICAL_COLUMNS},
+                            **{col: 'string[pyarrow]' for col in TEXT_COLUMNS}},
+                     parse_dates=['order_date'], date_format="%d-%m-%Y")
+
+    # write to a private temp file and rename it into place, so readers never
+    # see a half-written copy and concurrent cold starts don't interleave
+    tmp_file = None
+    try:
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(parquet_file) or '.', suffix='.parquet.tmp')
+        os.close(fd)
+        df.to_parquet(tmp_file, engine='pyarrow', compression='zstd')
+        # mkstemp creates the file owner-only; keep the copy world-readable
+        os.chmod(tmp_file, 0o644)
+        os.replace(tmp_file, parquet_file)
+    except OSError:
+        # read-only deployments just keep parsing the CSV
+        if tmp_file is not None and os.path.exists(tmp_file):
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    return df
+
+
+# cache_resource hands back the same frame by reference instead of
+# unpickling a copy on every hit, so callers must not mutate the returned df
+@st.cache_resource
 def load_data(csv_file: str) -> pd.DataFrame:
-    df = pd.read_csv(csv_file, encoding="cp1252")
-    df['order_date'] = pd.to_datetime(df['order_date'], format="%d-%m-%Y")
+    df = read_source(csv_file)
+
+    # keep rows in date order so date ranges resolve to a slice
+    df = df.sort_values('order_date', kind='stable', ignore_index=True)
+
+    # calendar parts are filter-invariant, so derive them once as small ints
+    df['month'] = df['order_date'].dt.month.astype('int8')
+    df['iso_week'] = df['order_date'].dt.isocalendar().week.to_numpy().astype('int8')
+    df['day_num'] = df['order_date'].dt.dayofweek.astype('int8')
+    # weekday names as an ordered categorical over the same codes, so
+    # grouping on it yields Monday..Sunday without a name lookup per row
+    df['day_of_week'] = pd.Categorical.from_codes(
+        df['day_num'], categories=DAYS_ORDER, ordered=True)
+
+    # integer period buckets (months since epoch, Monday-based weeks) are
+    # much cheaper to group on than building pd.Grouper bins per call;
+    # both stay below 2**15 until well past the year 2500
+    dates = df['order_date'].to_numpy()
+    df['month_bucket'] = dates.astype('datetime64[M]').astype('int16')
+    df['week_bucket'] = ((dates.astype('datetime64[D]').astype(
+        'int64') + 3) // 7).astype('int16')
+
+    # row-level margin; NaN where there are no sales so it drops out of plots
+    sales = df['sales_per_order'].to_numpy()
+    df['profit_margin_row'] = np.divide(
+        df['profit_per_order'].to_numpy(), sales,
+        out=np.full(len(df), np.nan, dtype='float32'), where=sales != 0) * 100
+
+    # delivery outcome flags so per-group counts are plain cython sums
+    status = df['delivery_status']
+    df['is_late'] = (status == 'Late delivery').to_numpy().astype('int8')
+    df['is_canceled'] = (status == 'Shipping canceled').to_numpy().astype('int8')
+    df['is_on_time'] = (status == 'Shipping on time').to_numpy().astype('int8')
     return df
 
 
+def month_end(buckets):
+    # month-end timestamps for month buckets, as pd.Grouper(freq='ME') labels
+    months = np.asarray(buckets).astype('datetime64[M]')
+    return pd.to_datetime((months + 1).astype('datetime64[D]') - 1)
+
+
+def week_end(buckets):
+    # the Sunday closing each week bucket, as pd.Grouper(freq='W') labels
+    days = np.asarray(buckets, dtype='int64') * 7 + 3
+    return pd.to_datetime(days.astype('datetime64[D]'))
+
+
+def fill_bucket_gaps(grouped):
+    # pd.Grouper emits zero-filled bins between the first and last period
+    if len(grouped):
+        grouped = grouped.reindex(
+            range(grouped.index.min(), grouped.index.max() + 1), fill_value=0)
+    return grouped
+
+
+def trailing_mean(values, window):
+    # rolling(window, min_periods=1).mean() from one cumulative sum
+    totals = np.cumsum(values, dtype='float64')
+    totals[window:] -= totals[:-window].copy()
+    return totals / np.minimum(np.arange(1, len(totals) + 1), window)
+
+
+def centered_mean(values, window):
+    # rolling(window, center=True, min_periods=1).mean() from one cumulative
+    # sum; windows are clipped at both ends of the series
+    totals = np.concatenate(([0.0], np.cumsum(values, dtype='float64')))
+    positions = np.arange(len(values))
+    lo = np.maximum(positions - window // 2, 0)
+    hi = np.minimum(positions + window - window // 2, len(values))
+    return (totals[hi] - totals[lo]) / (hi - lo)
+
+
+def category_sums(_df, key, sums, statuses=None):
+    # single-key groupby over categorical codes with np.bincount; like
+    # observed=True only categories that occur are kept, in category order
+    col = _df[key]
+    codes = col.cat.codes.to_numpy()
+    # rows with a missing key (code -1) are dropped, as groupby does
+    rows = codes >= 0
+    if rows.all():
+        rows = slice(None)
+    else:
+        codes = codes[rows]
+    n = len(col.cat.categories)
+    counts = np.bincount(codes, minlength=n)
+    present = np.flatnonzero(counts)
+    grouped = pd.DataFrame({
+        key: pd.Categorical.from_codes(present, dtype=col.dtype),
+        'size': counts[present]
+    })
+    for name, column in sums.items():
+        values = _df[column].to_numpy()[rows]
+        totals = np.bincount(codes, weights=values, minlength=n)[present]
+        grouped[name] = totals.astype(
+            'int64') if values.dtype.kind in 'iub' else totals
+
+    if statuses:
+        # all delivery statuses per group from one bincount over the combined
+        # (group, status) code rather than one flag sum per status; status
+        # codes are shifted by one so a missing status (code -1) gets its own
+        # column 0 instead of spilling into the previous group's last status
+        status = _df['delivery_status'].cat
+        n_status = len(status.categories) + 1
+        pair_counts = np.bincount(
+            codes.astype('int64') * n_status
+            + status.codes.to_numpy()[rows] + 1,
+            minlength=n * n_status).reshape(n, n_status)[present, 1:]
+        for name, label in statuses.items():
+            grouped[name] = pair_counts[:, status.categories.get_loc(
+                label)] if label in status.categories else 0
+    return grouped
+
+
+def state_codes(states):
+    # map the handful of state categories once, then expand by code
+    codes = states.cat.categories.str.strip().map(US_STATE_ABBREV)
+    return np.asarray(codes, dtype=object)[states.cat.codes.to_numpy()]
+
+
+@cached_aggregation
+def column_values(csv_file, column):
+    # keyed on the path alone; the options come from the full data
+    values = load_data(csv_file)[column]
+    # categoricals already hold their (sorted) distinct values
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.categories.tolist()
+    return sorted(values.dropna().unique().tolist())
+
+
+@cached_aggregation
+def product_categories(csv_file):
+    # every product belongs to exactly one category; built from the full data
+    return load_data(csv_file).drop_duplicates('product_name').set_index(
+        'product_name')['category_name']
+
+
+# Aggregations below are cached on (csv_file, filter_key); the leading
+# underscore keeps streamlit from hashing the filtered frame itself.
+@cached_aggregation
+def monthly_totals(_df, csv_file, filter_key):
+    # one scan shared by every monthly chart (trend, margin, bar chart)
+    grouped = _df.groupby('month_bucket')
+    df_monthly = grouped.agg(
+        sales_per_order=('sales_per_order', 'sum'),
+        profit_per_order=('profit_per_order', 'sum'),
+        discount_total=('order_item_discount', 'sum')
+    )
+    df_monthly['orders'] = grouped.size()
+    df_monthly = fill_bucket_gaps(df_monthly)
+    df_monthly.insert(0, 'order_date', month_end(df_monthly.index))
+
+    # sum / count keeps empty months at NaN, as the mean would
+    df_monthly['order_item_discount'] = (
+        df_monthly['discount_total'] / df_monthly['orders'])
+    df_monthly['profit_margin'] = (
+        df_monthly['profit_per_order'] / df_monthly['sales_per_order'] * 100)
+    return df_monthly.reset_index(drop=True)
+
+
+@cached_aggregation
+def category_sales(_df, csv_file, filter_key):
+    return category_sums(_df, 'category_name', {
+        'sales_per_order': 'sales_per_order'
+    }).drop(columns='size')
+
+
+@cached_aggregation
+def region_sales(_df, csv_file, filter_key):
+    # shares the scan behind the regional radar
+    return regional_metrics(_df, csv_file, filter_key)[
+        ['customer_region', 'revenue']].rename(
+        columns={'revenue': 'sales_per_order'}).sort_values(
+        'sales_per_order', ignore_index=True)
+
+
+@cached_aggregation
+def top_states(_df, csv_file, filter_key):
+    state_data = _df.groupby(['customer_region', 'customer_state'], as_index=False, observed=True).agg({
+        'sales_per_order': 'sum',
+        'profit_per_order': 'sum',
+        'order_id': 'count'
+    })
+
+    state_data['profit_margin'] = (
+        state_data['profit_per_order'] / state_data['sales_per_order'] * 100)
+    return state_data.nlargest(20, 'sales_per_order')
+
+
+@cached_aggregation
+def weekly_category_sales(_df, csv_file, filter_key):
+    df_weekly = _df.groupby(['week_bucket', 'category_name'], as_index=False, observed=True)[
+        'sales_per_order'].sum()
+    df_weekly.insert(0, 'order_date', week_end(df_weekly.pop('week_bucket')))
+    return df_weekly
+
+
+@cached_aggregation
+def top_products_by_revenue(_df, csv_file, filter_key):
+    product_sales = _df.groupby('product_name', sort=False)[
+        'sales_per_order'].sum()
+
+    # partial sort: only the 20 winners get ordered (ascending for the bars)
+    sales = product_sales.to_numpy()
+    top_idx = np.argpartition(sales, -20)[-20:] if len(
+        sales) > 20 else np.arange(len(sales))
+    top_idx = top_idx[np.argsort(sales[top_idx], kind='stable')]
+
+    top_products = product_sales.iloc[top_idx].reset_index()
+    top_products.insert(1, 'category_name', top_products['product_name'].map(
+        product_categories(csv_file)))
+    return top_products
+
+
+@cached_aggregation
+def segment_sales(_df, csv_file, filter_key):
+    return _df.groupby(['category_name', 'customer_segment'], as_index=False, observed=True)[
+        'sales_per_order'].sum()
+
+
+@cached_aggregation
+def quantity_distribution(_df, csv_file, filter_key):
+    # small non-negative ints: bincount is one pass and already in order
+    counts = np.bincount(_df['order_quantity'].to_numpy())
+    quantities = counts.nonzero()[0]
+    quantity_dist = pd.DataFrame(
+        {'quantity': quantities, 'count': counts[quantities]})
+
+    # Calculate percentages
+    quantity_dist['percentage'] = (
+        quantity_dist['count'] * (100.0 / quantity_dist['count'].sum())).round(1)
+    return quantity_dist
+
+
+@cached_aggregation
+def monthly_heatmap(_df, csv_file, filter_key):
+    # Aggregate on the integer codes and pivot the 7x12 result
+    heatmap_pivot = _df.groupby(['day_num', 'month'])[
+        'sales_per_order'].sum().unstack()
+
+    # Reorder days and map codes to names on the small grid only
+    heatmap_pivot = heatmap_pivot.reindex(range(7))
+    heatmap_pivot.index = DAYS_ORDER
+    heatmap_pivot.columns = [MONTHS_ORDER[m - 1]
+                             for m in heatmap_pivot.columns]
+    return heatmap_pivot
+
+
+@cached_aggregation
+def delivery_status_counts(_df, csv_file, filter_key):
+    status_counts = _df['delivery_status'].value_counts(
+    ).reset_index()
+    status_counts.columns = ['status', 'count']
+    # value_counts on a categorical lists unobserved statuses with zero
+    # counts; keep only the ones present, like observed=True
+    return status_counts[status_counts['count'] > 0]
+
+
+@cached_aggregation
+def delivery_by_shipping_type(_df, csv_file, filter_key):
+    counts = _df.groupby(['shipping_type', 'delivery_status'], observed=True).size(
+    ).unstack(fill_value=0)
+    return counts.div(counts.sum(axis=1), axis=0) * 100
+
+
+@cached_aggregation
+def delivery_time_by_region(_df, csv_file, filter_key):
+    region_stats = _df.groupby('customer_region', as_index=False, observed=True)[
+        'days_for_shipment_real'].agg(['mean', 'std'])
+    region_stats.columns = ['region', 'mean_days', 'std_days']
+    region_stats = region_stats.sort_values('mean_days', ascending=False)
+
+    # Overall average
+    overall_avg = _df['days_for_shipment_real'].mean()
+    return region_stats, overall_avg
+
+
+@cached_aggregation
+def weekly_delivery_rates(_df, csv_file, filter_key):
+    grouped = _df.groupby('week_bucket')
+    df_weekly = grouped[['is_late', 'is_canceled']].sum().rename(
+        columns={'is_late': 'late_deliveries', 'is_canceled': 'canceled'})
+    df_weekly.insert(0, 'total_orders', grouped.size())
+    df_weekly = fill_bucket_gaps(df_weekly)
+    df_weekly.insert(0, 'order_date', week_end(df_weekly.index))
+    df_weekly = df_weekly.reset_index(drop=True)
+
+    # Calculate rates
+    df_weekly['late_rate'] = (
+        df_weekly['late_deliveries'] / df_weekly['total_orders'] * 100)
+    df_weekly['cancel_rate'] = (
+        df_weekly['canceled'] / df_weekly['total_orders'] * 100)
+    return df_weekly
+
+
+@cached_aggregation
+def segment_totals(_df, csv_file, filter_key):
+    segment_data = category_sums(_df, 'customer_segment', {
+        'sales_per_order': 'sales_per_order'
+    }).rename(columns={'size': 'order_id'})
+    segment_data['aov'] = segment_data['sales_per_order'] / \
+        segment_data['order_id']
+
+    segment_data = segment_data.sort_values(
+        'sales_per_order', ascending=False)
+    return segment_data
+
+
+@cached_aggregation
+def top_cities_by_revenue(_df, csv_file, filter_key):
+    city_sales = _df.groupby(['customer_city', 'customer_state', 'customer_region'],
+                             as_index=False, sort=False, observed=True)[
+        'sales_per_order'].sum()
+    top_cities = city_sales.nlargest(20, 'sales_per_order').sort_values(
+        'sales_per_order', ascending=True)
+
+    top_cities['city_state'] = top_cities['customer_city'] + \
+        ', ' + top_cities['customer_state'].astype(str)
+    return top_cities
+
+
+@cached_aggregation
+def regional_metrics(_df, csv_file, filter_key):
+    region_metrics = category_sums(_df, 'customer_region', {
+        'revenue': 'sales_per_order',
+        'profit': 'profit_per_order'
+    }, statuses={
+        'on_time': 'Shipping on time'
+    }).rename(columns={'size': 'orders'})
+
+    region_metrics['aov'] = region_metrics['revenue'] / \
+        region_metrics['orders']
+    region_metrics['on_time_pct'] = (
+        region_metrics['on_time'] / region_metrics['orders'] * 100
+    )
+
+    # Normalize each metric to 0-100 scale
+    for col in ['revenue', 'profit', 'orders', 'aov', 'on_time_pct']:
+        max_val = region_metrics[col].max()
+        if max_val > 0:
+            region_metrics[f'{col}_norm'] = (
+                region_metrics[col] / max_val * 100)
+    return region_metrics
+
+
+@cached_aggregation
+def segment_category_sales(_df, csv_file, filter_key):
+    # same totals as segment_sales, only ordered segment-first
+    segment_category = segment_sales(_df, csv_file, filter_key)[
+        ['customer_segment', 'category_name', 'sales_per_order']].sort_values(
+        ['customer_segment', 'category_name'], ignore_index=True)
+    return segment_category
+
+
+# one pass over the state key feeds the delivery map, revenue map and pareto
+@cached_aggregation
+def state_totals(_df, csv_file, filter_key):
+    state_data = category_sums(_df, 'customer_state', {
+        'sales_per_order': 'sales_per_order',
+        'profit_per_order': 'profit_per_order'
+    }, statuses={
+        'on_time': 'Shipping on time',
+        'late': 'Late delivery'
+    }).rename(columns={'size': 'total_orders'})
+
+    state_data['on_time_rate'] = (
+        state_data['on_time'] / state_data['total_orders'] * 100)
+
+    state_data['state_code'] = state_codes(state_data['customer_state'])
+    return state_data
+
+
+@cached_aggregation
+def state_revenue_pareto(_df, csv_file, filter_key):
+    state_revenue = state_totals(_df, csv_file, filter_key)[
+        ['customer_state', 'sales_per_order']].sort_values(
+        'sales_per_order', ascending=False, ignore_index=True)
+
+    # running share of revenue, scaled in place on one array
+    cumulative_pct = np.cumsum(state_revenue['sales_per_order'].to_numpy())
+    if len(cumulative_pct):
+        cumulative_pct *= 100 / cumulative_pct[-1]
+    state_revenue['cumulative_pct'] = cumulative_pct
+    return state_revenue
+
+
+# one pass over the product key feeds the matrix, quantity ranking,
+# sunburst and low performers table
+@cached_aggregation
+def product_totals(_df, csv_file, filter_key):
+    product_data = _df.groupby(['product_name', 'category_name'], as_index=False, observed=True).agg({
+        'sales_per_order': 'sum',
+        'profit_per_order': 'sum',
+        'order_id': 'count',
+        'order_quantity': 'sum'
+    })
+
+    product_data['profit_margin'] = (
+        product_data['profit_per_order'] / product_data['sales_per_order'] * 100)
+    return product_data
+
+
+@cached_aggregation
+def top_product_performance(_df, csv_file, filter_key):
+    product_data = product_totals(_df, csv_file, filter_key)
+
+    product_data = product_data.nlargest(100, 'sales_per_order')
+
+    return product_data
+
+
+@cached_aggregation
+def top_products_by_quantity(_df, csv_file, filter_key):
+    product_qty = product_totals(_df, csv_file, filter_key)
+    top_products = product_qty.nlargest(20, 'order_quantity').sort_values(
+        'order_quantity', ascending=True)
+    return top_products
+
+
+@cached_aggregation
+def category_top_products(_df, csv_file, filter_key):
+    product_data = product_totals(_df, csv_file, filter_key)
+
+    # sort once, then take each category's first five rows
+    top_products = product_data.sort_values(
+        ['category_name', 'sales_per_order'], ascending=[True, False]
+    ).groupby('category_name', sort=False, observed=True).head(5)
+
+    # category totals roll up from the product sums
+    category_totals = product_data.groupby('category_name', as_index=False, observed=True)[
+        ['sales_per_order', 'profit_per_order']].sum()
+    category_totals['profit_margin'] = (
+        category_totals['profit_per_order'] / category_totals['sales_per_order'] * 100)
+    category_totals['product_name'] = ''
+    return top_products, category_totals
+
+
+@cached_aggregation
+def low_performing_products(_df, csv_file, filter_key):
+    product_data = product_totals(_df, csv_file, filter_key)
+    sales = product_data['sales_per_order'].to_numpy()
+    sales_q10 = np.quantile(sales, 0.1) if len(sales) else np.nan
+    mask = (product_data['profit_per_order'].to_numpy() < 0) | (sales < sales_q10)
+
+    # partial selection of the 20 worst instead of sorting every match
+    low_performers = product_data[mask].nsmallest(20, 'profit_per_order')
+    return low_performers
+
+
+@cached_aggregation
+def daily_sales(_df, csv_file, filter_key):
+    # rows are date-sorted at load, so first-seen order is already by date
+    df_daily = _df.groupby('order_date', as_index=False, sort=False)[
+        'sales_per_order'].sum()
+
+    sales = df_daily['sales_per_order'].to_numpy()
+    df_daily['ma_7'] = trailing_mean(sales, 7)
+    df_daily['ma_30'] = trailing_mean(sales, 30)
+    return df_daily
+
+
+@cached_aggregation
+def product_monthly_sales(_df, csv_file, filter_key, selected_products=None):
+    if selected_products is None:
+        top_products = _df.groupby(
+            'product_name')['sales_per_order'].sum().nlargest(5).index.tolist()
+        selected_products = top_products
+
+    # take only the three columns the groupby reads, not whole rows
+    df_filtered = _df.loc[_df['product_name'].isin(selected_products),
+                          ['month_bucket', 'product_name', 'sales_per_order']]
+
+    df_monthly = df_filtered.groupby(['month_bucket', 'product_name'], as_index=False)[
+        'sales_per_order'].sum()
+    df_monthly.insert(0, 'order_date', month_end(df_monthly.pop('month_bucket')))
+    return df_monthly
+
+
+@cached_aggregation
+def top_products_by_profit(_df, csv_file, filter_key):
+    product_profit = _df.groupby('product_name', as_index=False, sort=False)[
+        'profit_per_order'].sum()
+    top_products = product_profit.nlargest(10, 'profit_per_order').sort_values(
+        'profit_per_order', ascending=False)
+    return top_products
+
+
+@cached_aggregation
+def day_of_week_sales(_df, csv_file, filter_key):
+    # the ordered weekday categorical groups straight into Monday..Sunday
+    dow_sales = category_sums(_df, 'day_of_week', {
+        'sales_per_order': 'sales_per_order'
+    })
+    dow_sales['sales_per_order'] /= dow_sales.pop('size')
+    return dow_sales
+
+
+@cached_aggregation
+def weekly_heatmap(_df, csv_file, filter_key):
+    # aggregate and reshape in one pivot; days with no orders come back as
+    # empty rows so the grid always runs Monday..Sunday
+    heatmap_pivot = _df.pivot_table(
+        index='day_of_week', columns='iso_week', values='sales_per_order',
+        aggfunc='sum', observed=True).reindex(DAYS_ORDER)
+    return heatmap_pivot
+
+
+@cached_aggregation
+def quarterly_sales(_df, csv_file, filter_key):
+    # the month fixes the quarter, so one bincount over month numbers
+    # gives every (quarter, month) total
+    months = _df['month'].to_numpy()
+    totals = np.bincount(months, weights=_df['sales_per_order'].to_numpy(),
+                         minlength=13)
+    present = np.flatnonzero(np.bincount(months, minlength=13))
+    quarterly_data = pd.DataFrame({
+        'quarter': (present - 1) // 3 + 1,
+        'month': present,
+        'sales_per_order': totals[present]
+    })
+    quarterly_data['quarter_label'] = 'Q' + \
+        quarterly_data['quarter'].astype(str)
+    return quarterly_data
+
+
+@cached_aggregation
+def weekly_decomposition(_df, csv_file, filter_key):
+    # roll the per-category weekly totals up rather than scanning rows again;
+    # empty weeks are zero-filled as pd.Grouper(freq='W') would
+    weekly = weekly_category_sales(_df, csv_file, filter_key).groupby(
+        'order_date')['sales_per_order'].sum()
+    if len(weekly):
+        weekly = weekly.reindex(pd.date_range(
+            weekly.index.min(), weekly.index.max(), freq='W-SUN'), fill_value=0)
+    df_weekly = pd.DataFrame({
+        'order_date': weekly.index,
+        'sales_per_order': weekly.to_numpy()
+    })
+
+    df_weekly['trend'] = centered_mean(df_weekly['sales_per_order'].to_numpy(), 4)
+
+    # additive week-of-year index: the mean detrended value for each ISO week,
+    # centred on zero, with residual = original - trend - seasonal so the three
+    # parts add back up to the series. a week seen only once would just copy
+    # its own value into the index (flattening the residual), so only weeks
+    # with at least two years of data get one. the 4-week trend is much shorter
+    # than the 52-week period, so it already follows most of the yearly swing;
+    # the index only picks up what is left at the week-to-week scale
+    detrended = (df_weekly['sales_per_order'] - df_weekly['trend']).to_numpy()
+    weeks = df_weekly['order_date'].dt.isocalendar().week.to_numpy().astype('int64')
+    counts = np.bincount(weeks, minlength=54)
+    repeated = counts > 1
+    index = np.zeros(len(counts))
+    if repeated.any():
+        index[repeated] = np.bincount(weeks, weights=detrended, minlength=54)[
+            repeated] / counts[repeated]
+        index[repeated] -= index[repeated].mean()
+
+    df_weekly['seasonal'] = index[weeks]
+    df_weekly['residual'] = detrended - df_weekly['seasonal']
+    return df_weekly
+
+
+@cached_aggregation
+def kpi_totals(_df, csv_file, filter_key):
+    # every headline figure comes from two column sums and one status count
+    sales = _df['sales_per_order'].to_numpy()
+    profit = _df['profit_per_order'].to_numpy()
+
+    # count every status in one pass over the integer category codes;
+    # shifted by one so missing values (code -1) land in bin 0
+    categories = _df['delivery_status'].cat.categories
+    status_counts = np.bincount(
+        _df['delivery_status'].cat.codes.to_numpy() + 1,
+        minlength=len(categories) + 1)[1:]
+    status_counts = dict(zip(categories, status_counts))
+
+    total_revenue = sales.sum()
+    total_profit = profit.sum()
+    total_orders = len(sales)
+    profit_margin = (total_profit / total_revenue *
+                     100) if total_revenue > 0 else 0
+    avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
+    on_time_rate = status_counts.get('Shipping on time', 0) / \
+        total_orders * 100 if total_orders > 0 else 0
+    late_deliveries = status_counts.get('Late delivery', 0)
+
+    return total_revenue, total_profit, total_orders, profit_margin, avg_order_value, on_time_rate, late_deliveries
+
+
 class Data:
     def __init__(self, csv_file):
+        self.csv_file = csv_file
         self.df = load_data(csv_file)
-        self.filtered_df = self.df.copy()
+        self.filtered_df = self.df
 
         # store filters internally
         self.filters = {
@@ -48,60 +730,101 @@ class Data:
             "shipping_type": None,
             "date_range": None,
         }
-
-        self.df['order_date'] = pd.to_datetime(
-            self.df['order_date'], format='%d-%m-%Y')
+        self.filter_key = self.build_filter_key()
 
     def set_filters(self, **kwargs):
         self.filters.update(kwargs)
+        self.filter_key = self.build_filter_key()
         self.apply_filters()
 
+    def build_filter_key(self):
+        # hashable snapshot of the active filters, used as the cache key
+        key = []
+        for name, values in sorted(self.filters.items()):
+            if not values:
+                values = None
+            elif name == "date_range":
+                values = tuple(values)
+            else:
+                values = tuple(sorted(values))
+            key.append((name, values))
+        return tuple(key)
+
     def apply_filters(self):
-        df = self.df.copy()
+        df = self.df
 
+        # order_date is sorted at load, so the range is a binary search + slice
         date_range = self.filters.get("date_range")
         if date_range:
             start_date, end_date = pd.to_datetime(
                 date_range[0]), pd.to_datetime(date_range[1])
-            df = df[(df['order_date'] >= start_date)
-                    & (df['order_date'] <= end_date)]
-
+            lo = df['order_date'].searchsorted(start_date, side='left')
+            hi = df['order_date'].searchsorted(end_date, side='right')
+            df = df.iloc[lo:hi]
+
+        # combine the remaining filters into one boolean mask and index once;
+        # each test is a lookup of the row's category code in a small table of
+        # allowed categories (the trailing False catches code -1, i.e. NaN).
+        # a selection covering every category restricts nothing, like an
+        # empty one, so it adds no pass over the rows
+        mask = None
         for column in ["customer_region", "category_name", "customer_segment", "delivery_status", "shipping_type"]:
             values = self.filters.get(column)
             if values and len(values) > 0:
-                df = df[df[column].isin(values)]
+                allowed = df[column].cat.categories.isin(values)
+                if allowed.all():
+                    continue
+                keep = np.append(allowed, False)[
+                    df[column].cat.codes.to_numpy()]
+                mask = keep if mask is None else mask & keep
 
-        self.filtered_df = df
+        self.filtered_df = df if mask is None else df[mask]
 
     def unique_values(self, column):
-        return sorted(self.df[column].unique())
+        return column_values(self.csv_file, column)
 
     def compute_kpis(self):
-        df = self.filtered_df
-
-        total_revenue = df['sales_per_order'].sum()
-        total_profit = df['profit_per_order'].sum()
-        total_orders = len(df)
-        profit_margin = (total_profit / total_revenue *
-                         100) if total_revenue > 0 else 0
-        avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
-        on_time_rate = (df['delivery_status'] == 'Shipping on time').sum(
-        ) / total_orders * 100 if total_orders > 0 else 0
-        late_deliveries = (df['delivery_status'] == 'Late delivery').sum()
-
-        return total_revenue, total_profit, total_orders, profit_margin, avg_order_value, on_time_rate, late_deliveries
+        return kpi_totals(self.filtered_df, self.csv_file, self.filter_key)
 
 
 PRIMARY_COLOR = '#13957b'
 SECONDARY_COLORS = ['#13957b', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
 
 
-def apply_chart_styling(fig, title=""):
+def sample_rows(df, columns, max_rows=5000, seed=42):
+    # gather only the plotted columns at a sorted random sample of positions
+    positions = np.arange(len(df))
+    if len(df) > max_rows:
+        positions = np.sort(np.random.default_rng(seed).choice(
+            len(df), size=max_rows, replace=False))
+    return df.iloc[positions, df.columns.get_indexer(columns)]
+
+
+def truncate_labels(names, max_len):
+    # vectorized "name[:max_len] + '...'" over a string Series
+    return np.where(names.str.len() > max_len,
+                    names.str.slice(0, max_len) + '...', names)
+
+
+def format_currency(values):
+    # $1,234 with thousands separators
+    return '$' + pd.Series(values, dtype='float64').map(
+        '{:,.0f}'.format).to_numpy(dtype=object)
+
+
+def format_short_currency(values):
+    # $1.23M for millions, $456K otherwise
+    values = np.asarray(values, dtype=float)
+    return np.where(values >= 1000000,
+                    np.char.mod('$%.2fM', values / 1000000),
+                    np.char.mod('$%.0fK', values / 1000))
+
+
+def apply_chart_styling(fig, title="", title_color='white'):
     fig.update_layout(
         title={
             'text': title,
-            'font': {'size': 24, 'color': 'white' if st.get_option(
-                "theme.base") != "dark" else "#2d3748"}
+            'font': {'size': 24, 'color': title_color}
         } if title else None,
         font=dict(color='#2d3748'),
         margin=dict(l=10, r=10, t=50 if title else 10, b=10),
@@ -115,16 +838,40 @@ def apply_chart_styling(fig, title=""):
     return fig
 
 
+# cache_resource hands back the built figure itself; st.plotly_chart only
+# reads it, so nothing downstream mutates the shared object
+@st.cache_resource(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def built_figure(_chart, _method, csv_file, filter_key, title_color, name,
+                 args, kwargs):
+    return _method(_chart, *args, **kwargs)
+
+
+def memoize_figure(method):
+    # a chart is a pure function of the filters, theme colour and arguments,
+    # so reruns with unchanged filters skip rebuilding the figure
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return built_figure(self, method, self.csv_file, self.filter_key,
+                            self.title_color, method.__name__, args, kwargs)
+    return wrapper
+
+
 class Chart(Data):
     def __init__(self, csv_file: str, theme: str = "plotly"):
         super().__init__(csv_file)
         self.theme = theme
 
+        # resolve the title colour once instead of in every layout dict
+        self.title_color = 'white' if st.get_option(
+            "theme.base") != "dark" else "#2d3748"
+
+    def title_dict(self, text, size=24):
+        return {'text': text, 'font': {'size': size, 'color': self.title_color}}
+
+    @memoize_figure
     def create_revenue_trend_chart(self):
-        df_monthly = self.filtered_df.groupby(pd.Grouper(key='order_date', freq='ME')).agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum'
-        }).reset_index()
+        df_monthly = monthly_totals(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = make_subplots(specs=[[{"secondary_y": True}]])
 
@@ -162,28 +909,26 @@ class Chart(Data):
         fig.update_xaxes(title_text="Date", showgrid=True,
                          gridcolor='rgba(128,128,128,0.2)')
 
-        apply_chart_styling(fig, "Revenue & Profit Trend Over Time")
+        apply_chart_styling(
+            fig, "Revenue & Profit Trend Over Time", self.title_color)
 
         return fig
 
+    @memoize_figure
     def create_sales_by_category_chart(self):
-        category_sales = self.filtered_df.groupby(
-            'category_name')['sales_per_order'].sum().reset_index()
+        df_category = category_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(data=[go.Pie(
-            labels=category_sales['category_name'],
-            values=category_sales['sales_per_order'],
+            labels=df_category['category_name'],
+            values=df_category['sales_per_order'],
             hole=0.4,
             marker=dict(colors=['#13957b', '#ff7f0e', '#2ca02c']),
             hovertemplate='<b>%{label}</b><br>Revenue: $%{value:,.0f}<br>Percentage: %{percent}<extra></extra>'
         )])
 
         fig.update_layout(
-            title={
-                'text': "Sales by Category",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Sales by Category"),
             height=400,
             showlegend=True,
             legend=dict(orientation="h", yanchor="bottom",
@@ -192,60 +937,46 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_revenue_by_region_chart(self):
-        region_sales = self.filtered_df.groupby('customer_region')[
-            'sales_per_order'].sum().sort_values(ascending=True).reset_index()
+        df_region = region_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(go.Bar(
-            x=region_sales['sales_per_order'],
-            y=region_sales['customer_region'],
+            x=df_region['sales_per_order'],
+            y=df_region['customer_region'],
             orientation='h',
             marker=dict(
-                color=region_sales['sales_per_order'],
+                color=df_region['sales_per_order'],
                 colorscale='Blues',
                 showscale=False
             ),
-            text=region_sales['sales_per_order'].apply(
-                lambda x: f'${x/1000000:.2f}M' if x >= 1000000 else f'${x/1000:.0f}K'),
+            text=format_short_currency(df_region['sales_per_order']),
             textposition='auto',
             hovertemplate='<b>%{y}</b><br>Revenue: $%{x:,.0f}<extra></extra>'
         ))
 
         fig.update_layout(
-            title={
-                'text': "Revenue by Region",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
-            xaxis_title={'text': "Revenue ($)", 'font': {
-                'size': 18, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}},
-            yaxis_title={'text': "Region", 'font': {
-                'size': 18, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}},
+            title=self.title_dict("Revenue by Region"),
+            xaxis_title=self.title_dict("Revenue ($)", 18),
+            yaxis_title=self.title_dict("Region", 18),
             height=400,
         )
 
         return fig
 
+    @memoize_figure
     def create_top_states_treemap(self):
-        state_data = self.filtered_df.groupby(['customer_region', 'customer_state']).agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum',
-            'order_id': 'count'
-        }).reset_index()
-
-        state_data['profit_margin'] = (
-            state_data['profit_per_order'] / state_data['sales_per_order'] * 100)
-        top_states = state_data.nlargest(20, 'sales_per_order')
+        df_states = top_states(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = px.treemap(
-            top_states,
+            df_states,
             path=[px.Constant("All"), 'customer_region', 'customer_state'],
             values='sales_per_order',
             color='profit_margin',
             color_continuous_scale='RdYlGn',
-            color_continuous_midpoint=top_states['profit_margin'].median(),
+            color_continuous_midpoint=df_states['profit_margin'].median(),
             hover_data={
                 'sales_per_order': ':,.0f',
                 'profit_per_order': ':,.0f',
@@ -275,19 +1006,16 @@ class Chart(Data):
         )
 
         fig.update_layout(
-            title={
-                'text': "Top 20 States by Revenue (Color = Profit Margin)",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Top 20 States by Revenue (Color = Profit Margin)"),
             height=450,
         )
 
         return fig
 
+    @memoize_figure
     def create_sales_trend_by_category_chart(self):
-        df_weekly = self.filtered_df.groupby([pd.Grouper(key='order_date', freq='W'), 'category_name'])[
-            'sales_per_order'].sum().reset_index()
+        df_weekly = weekly_category_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = px.line(
             df_weekly,
@@ -302,11 +1030,7 @@ class Chart(Data):
         fig.update_traces(mode='lines', hovertemplate='%{y:$,.0f}')
 
         fig.update_layout(
-            title={
-                'text': "Sales Trend by Category",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Sales Trend by Category"),
             height=400,
             hovermode='x unified',
             legend=dict(orientation="h", yanchor="bottom",
@@ -330,16 +1054,14 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_top_products_chart(self):
-        product_sales = self.filtered_df.groupby(['product_name', 'category_name'])[
-            'sales_per_order'].sum().reset_index()
-        top_products = product_sales.nlargest(
-            20, 'sales_per_order').sort_values('sales_per_order', ascending=True)
+        top_products = top_products_by_revenue(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         # Truncate long product names
-        top_products['product_name_short'] = top_products['product_name'].apply(
-            lambda x: x[:50] + '...' if len(x) > 50 else x
-        )
+        top_products['product_name_short'] = truncate_labels(
+            top_products['product_name'], 50)
 
         fig = px.bar(
             top_products,
@@ -356,11 +1078,7 @@ class Chart(Data):
             hovertemplate='%{y}<br>Revenue: $%{x:,.0f}<extra></extra>')
 
         fig.update_layout(
-            title={
-                'text': "Top 20 Products by Revenue",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Top 20 Products by Revenue"),
             height=600,
             showlegend=True,
             legend=dict(orientation="h", yanchor="bottom",
@@ -369,12 +1087,13 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_sales_by_segment_chart(self):
-        segment_sales = self.filtered_df.groupby(['category_name', 'customer_segment'])[
-            'sales_per_order'].sum().reset_index()
+        df_segment = segment_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = px.bar(
-            segment_sales,
+            df_segment,
             x='category_name',
             y='sales_per_order',
             color='customer_segment',
@@ -388,11 +1107,7 @@ class Chart(Data):
             hovertemplate='%{x}<br>%{data.name}<br>Revenue: $%{y:,.0f}<extra></extra>')
 
         fig.update_layout(
-            title={
-                'text': "Sales by Customer Segment & Category",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Sales by Customer Segment & Category"),
             height=400,
             legend=dict(orientation="h", yanchor="bottom",
                         y=1.02, xanchor="right", x=1)
@@ -400,14 +1115,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_quantity_distribution_chart(self):
-        quantity_dist = self.filtered_df['order_quantity'].value_counts(
-        ).sort_index().reset_index()
-        quantity_dist.columns = ['quantity', 'count']
-
-        # Calculate percentages
-        quantity_dist['percentage'] = (
-            quantity_dist['count'] / quantity_dist['count'].sum() * 100).round(1)
+        quantity_dist = quantity_distribution(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(go.Bar(
             x=quantity_dist['quantity'],
@@ -415,83 +1126,49 @@ class Chart(Data):
             marker=dict(
                 color=['#13957b', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
             ),
-            text=quantity_dist['percentage'].apply(lambda x: f'{x}%'),
+            text=quantity_dist['percentage'].astype(str) + '%',
             textposition='auto',
             hovertemplate='Quantity: %{x}<br>Orders: %{y:,}<br>Percentage: %{text}<extra></extra>'
         ))
 
         fig.update_layout(
-            title={
-                'text': "Order Quantity Distribution",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                        "theme.base") != "dark" else "#2d3748"}
-            },
-            xaxis_title={'text': "Quantity per Order",
-                         'font': {'size': 18, 'color': 'white' if st.get_option(
-                             "theme.base") != "dark" else "#2d3748"}},
-            yaxis_title={'text': "Number of Orders",
-                         'font': {'size': 18, 'color': 'white' if st.get_option(
-                             "theme.base") != "dark" else "#2d3748"}},
+            title=self.title_dict("Order Quantity Distribution"),
+            xaxis_title=self.title_dict("Quantity per Order", 18),
+            yaxis_title=self.title_dict("Number of Orders", 18),
             height=400
         )
 
         return fig
 
+    @memoize_figure
     def create_monthly_sales_heatmap(self):
-        df_copy = self.filtered_df.copy()
-
-        df_copy['month'] = df_copy['order_date'].dt.month_name()
-        df_copy['day_of_week'] = df_copy['order_date'].dt.day_name()
-
-        # Aggregate
-        heatmap_data = df_copy.groupby(['day_of_week', 'month'])[
-            'sales_per_order'].sum().reset_index()
-
-        # Pivot for heatmap
-        heatmap_pivot = heatmap_data.pivot(
-            index='day_of_week', columns='month', values='sales_per_order')
-
-        # Reorder days and months
-        days_order = ['Monday', 'Tuesday', 'Wednesday',
-                      'Thursday', 'Friday', 'Saturday', 'Sunday']
-        months_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                        'July', 'August', 'September', 'October', 'November', 'December']
-
-        heatmap_pivot = heatmap_pivot.reindex(days_order)
-        heatmap_pivot = heatmap_pivot[[
-            m for m in months_order if m in heatmap_pivot.columns]]
+        heatmap_pivot = monthly_heatmap(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(data=go.Heatmap(
-            z=heatmap_pivot.values,
-            x=heatmap_pivot.columns,
-            y=heatmap_pivot.index,
+            # row-major float32 grid and plain label arrays serialize in one
+            # sequential pass
+            z=np.ascontiguousarray(heatmap_pivot.to_numpy(dtype='float32')),
+            x=heatmap_pivot.columns.to_numpy(),
+            y=heatmap_pivot.index.to_numpy(),
             colorscale='Blues',
             hovertemplate='%{y}, %{x}<br>Revenue: $%{z:,.0f}<extra></extra>',
-            colorbar=dict(title={'text': "Revenue ($)", 'font': {
-                        'size': 18, 'color': 'white' if st.get_option(
-                            "theme.base") != "dark" else "#2d3748"}})
+            colorbar=dict(title=self.title_dict("Revenue ($)", 18))
         ))
 
         fig.update_layout(
-            title={
-                'text': "Sales Heatmap: Day of Week vs Month",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
-            xaxis_title={'text': "Month", 'font': {
-                'size': 18, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}},
-            yaxis_title={'text': "Day of Week", 'font': {
-                'size': 18, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}},
+            title=self.title_dict("Sales Heatmap: Day of Week vs Month"),
+            xaxis_title=self.title_dict("Month", 18),
+            yaxis_title=self.title_dict("Day of Week", 18),
             height=700
         )
 
         return fig
 
+    @memoize_figure
     def create_profit_vs_revenue_scatter(self):
-        df_sample = self.filtered_df.sample(n=min(5000, len(self.filtered_df)), random_state=42) if len(
-            self.filtered_df) > 5000 else self.filtered_df
+        df_sample = sample_rows(self.filtered_df, [
+            'sales_per_order', 'profit_per_order', 'category_name', 'order_quantity'])
 
         fig = px.scatter(
             df_sample,
@@ -502,11 +1179,13 @@ class Chart(Data):
             labels={
                 'sales_per_order': 'Revenue ($)', 'profit_per_order': 'Profit ($)', 'category_name': 'Category'},
             color_discrete_sequence=['#13957b', '#ff7f0e', '#2ca02c'],
-            opacity=0.6
+            opacity=0.6,
+            # thousands of markers draw far faster on WebGL than as SVG nodes
+            render_mode='webgl'
         )
 
-        max_val = max(df_sample['sales_per_order'].max(),
-                      df_sample['profit_per_order'].max())
+        max_val = df_sample[['sales_per_order',
+                             'profit_per_order']].to_numpy().max(initial=0)
         fig.add_trace(go.Scatter(
             x=[0, max_val],
             y=[0, max_val],
@@ -517,11 +1196,7 @@ class Chart(Data):
         ))
 
         fig.update_layout(
-            title={
-                'text': "Profit vs Revenue Analysis",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Profit vs Revenue Analysis"),
             height=500,
             legend=dict(orientation="h", yanchor="bottom",
                         y=1.02, xanchor="right", x=1),
@@ -531,30 +1206,25 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_profit_margin_by_category_chart(self):
-        df_copy = self.filtered_df.copy()
-        df_copy['profit_margin'] = (
-            df_copy['profit_per_order'] / df_copy['sales_per_order'] * 100)
-
         # Remove extreme outliers for better visualization
-        df_copy = df_copy[df_copy['profit_margin'].between(-100, 100)]
+        df_margin = self.filtered_df.loc[
+            self.filtered_df['profit_margin_row'].between(-100, 100),
+            ['category_name', 'profit_margin_row']]
 
         fig = px.box(
-            df_copy,
+            df_margin,
             x='category_name',
-            y='profit_margin',
+            y='profit_margin_row',
             color='category_name',
             labels={'category_name': 'Category',
-                    'profit_margin': 'Profit Margin (%)'},
+                    'profit_margin_row': 'Profit Margin (%)'},
             color_discrete_sequence=['#13957b', '#ff7f0e', '#2ca02c']
         )
 
         fig.update_layout(
-            title={
-                'text': "Profit Margin Distribution by Category",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Profit Margin Distribution by Category"),
             height=400,
             showlegend=False,
             plot_bgcolor='rgba(0,0,0,0)',
@@ -563,25 +1233,53 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_discount_impact_chart(self):
+        df_sample = sample_rows(self.filtered_df, [
+            'order_item_discount', 'profit_per_order', 'category_name'])
+
         fig = px.scatter(
-            self.filtered_df,
+            df_sample,
             x='order_item_discount',
             y='profit_per_order',
             color='category_name',
-            trendline='ols',
             labels={
                 'order_item_discount': 'Discount (%)', 'profit_per_order': 'Profit ($)', 'category_name': 'Category'},
             color_discrete_sequence=['#13957b', '#ff7f0e', '#2ca02c'],
-            opacity=0.5
-        )
+            opacity=0.5,
+            render_mode='webgl'
+        )
+
+        # Least-squares trend per category, fitted on all filtered rows
+        # the columns are pulled out as arrays once and split by category
+        # code, rather than materialising a sub-frame of every column per group
+        colors = {trace.name: trace.marker.color for trace in fig.data}
+        categories = self.filtered_df['category_name'].cat.categories
+        codes = self.filtered_df['category_name'].cat.codes.to_numpy()
+        order = np.argsort(codes, kind='stable')
+        bounds = np.cumsum(np.bincount(codes + 1, minlength=len(categories) + 1))
+        discounts = self.filtered_df['order_item_discount'].to_numpy()[order]
+        profits = self.filtered_df['profit_per_order'].to_numpy()[order]
+        for category, start, stop in zip(categories, bounds[:-1], bounds[1:]):
+            discount = discounts[start:stop]
+            if len(discount) == 0 or discount.min() == discount.max():
+                continue
+            slope, intercept = np.polyfit(discount, profits[start:stop], 1)
+            xs = np.array([discount.min(), discount.max()])
+
+            fig.add_trace(go.Scatter(
+                x=xs,
+                y=slope * xs + intercept,
+                mode='lines',
+                name=category,
+                legendgroup=category,
+                showlegend=False,
+                line=dict(color=colors.get(category)),
+                hovertemplate=f'<b>{category} trend</b><br>Profit = {slope:,.2f} × Discount + {intercept:,.2f}<extra></extra>'
+            ))
 
         fig.update_layout(
-            title={
-                'text': "Discount Impact on Profitability",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Discount Impact on Profitability"),
             height=400,
             legend=dict(orientation="h", yanchor="bottom",
                         y=1.02, xanchor="right", x=1)
@@ -589,20 +1287,18 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_top_profitable_products_chart(self):
-        product_profit = self.filtered_df.groupby(
-            'product_name')['profit_per_order'].sum().reset_index()
-        top_products = product_profit.nlargest(10, 'profit_per_order').sort_values(
-            'profit_per_order', ascending=False)
+        top_products = top_products_by_profit(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         # Truncate long names
-        top_products['product_name_short'] = top_products['product_name'].apply(
-            lambda x: x[:40] + '...' if len(x) > 40 else x
-        )
+        top_products['product_name_short'] = truncate_labels(
+            top_products['product_name'], 40)
 
         # Create waterfall values
         values = top_products['profit_per_order'].tolist()
-        text = [f'${v:,.0f}' for v in values]
+        text = format_currency(values)
 
         fig = go.Figure(go.Waterfall(
             name="Profit",
@@ -619,11 +1315,7 @@ class Chart(Data):
         ))
 
         fig.update_layout(
-            title={
-                'text': "Top 10 Most Profitable Products",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Top 10 Most Profitable Products"),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             xaxis_title="Product",
@@ -634,16 +1326,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_profit_margin_trend_chart(self):
-        df_monthly = self.filtered_df.groupby(pd.Grouper(key='order_date', freq='ME')).agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum',
-            'order_item_discount': 'mean'
-        }).reset_index()
-
-        # Calculate profit margin
-        df_monthly['profit_margin'] = (
-            df_monthly['profit_per_order'] / df_monthly['sales_per_order'] * 100)
+        df_monthly = monthly_totals(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         # Create figure with secondary y-axis
         fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -673,11 +1359,7 @@ class Chart(Data):
         )
 
         fig.update_layout(
-            title={
-                'text': "Profit Margin & Discount Trends",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Profit Margin & Discount Trends"),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             hovermode='x unified',
@@ -691,10 +1373,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_delivery_status_chart(self):
-        status_counts = self.filtered_df['delivery_status'].value_counts(
-        ).reset_index()
-        status_counts.columns = ['status', 'count']
+        status_counts = delivery_status_counts(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         # Define colors
         colors = {
@@ -704,12 +1386,12 @@ class Chart(Data):
             'Shipping canceled': '#7f7f7f'
         }
 
-        color_list = [colors.get(status, '#13957b')
-                      for status in status_counts['status']]
+        color_list = status_counts['status'].astype(object).map(
+            colors).fillna('#13957b').to_numpy()
 
         # Create pull effect for late delivery
-        pull = [0.1 if status ==
-                'Late delivery' else 0 for status in status_counts['status']]
+        pull = np.where(status_counts['status'].to_numpy()
+                        == 'Late delivery', 0.1, 0)
 
         fig = go.Figure(data=[go.Pie(
             labels=status_counts['status'],
@@ -720,11 +1402,7 @@ class Chart(Data):
         )])
 
         fig.update_layout(
-            title={
-                'text': "Delivery Status Distribution",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Delivery Status Distribution"),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             height=400,
@@ -735,9 +1413,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_delivery_by_shipping_type_chart(self):
-        delivery_shipping = pd.crosstab(
-            self.filtered_df['shipping_type'], self.filtered_df['delivery_status'], normalize='index') * 100
+        delivery_shipping = delivery_by_shipping_type(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         colors = {
             'Shipping on time': '#2ca02c',
@@ -758,11 +1437,7 @@ class Chart(Data):
             ))
 
         fig.update_layout(
-            title={
-                'text': "Delivery Performance by Shipping Type",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Delivery Performance by Shipping Type"),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             xaxis_title="Shipping Type",
@@ -775,14 +1450,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_delivery_time_by_region_chart(self):
-        region_stats = self.filtered_df.groupby('customer_region')[
-            'days_for_shipment_real'].agg(['mean', 'std']).reset_index()
-        region_stats.columns = ['region', 'mean_days', 'std_days']
-        region_stats = region_stats.sort_values('mean_days', ascending=False)
-
-        # Overall average
-        overall_avg = self.filtered_df['days_for_shipment_real'].mean()
+        region_stats, overall_avg = delivery_time_by_region(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure()
 
@@ -795,7 +1466,7 @@ class Chart(Data):
             marker=dict(
                 color=['#13957b', '#ff7f0e', '#2ca02c', '#d62728']
             ),
-            text=region_stats['mean_days'].apply(lambda x: f'{x:.1f} days'),
+            text=np.char.mod('%.1f days', region_stats['mean_days'].to_numpy()),
             textposition='auto',
             hovertemplate='%{x}<br>Avg Days: %{y:.2f}<br>Std Dev: %{error_y.array:.2f}<extra></extra>'
         ))
@@ -810,11 +1481,7 @@ class Chart(Data):
         )
 
         fig.update_layout(
-            title={
-                'text': "Average Delivery Time by Region (with Std Dev)",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Average Delivery Time by Region (with Std Dev)"),
             xaxis_title="Region",
             yaxis_title="Average Days",
             height=400,
@@ -825,6 +1492,7 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_delivery_time_by_shipping_chart(self):
         fig = px.box(
             self.filtered_df,
@@ -838,11 +1506,7 @@ class Chart(Data):
         )
 
         fig.update_layout(
-            title={
-                'text': "Delivery Time Distribution by Shipping Type",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Delivery Time Distribution by Shipping Type"),
             height=400,
             showlegend=False,
             plot_bgcolor='rgba(0,0,0,0)',
@@ -851,25 +1515,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_late_delivery_trend_chart(self):
-        df_weekly = (
-            self.filtered_df
-            .groupby(pd.Grouper(key='order_date', freq='W'))
-            .agg(
-                total_orders=('order_date', 'size'),
-                late_deliveries=('delivery_status',
-                                 lambda x: (x == 'Late delivery').sum()),
-                canceled=('delivery_status',
-                          lambda x: (x == 'Shipping canceled').sum())
-            )
-            .reset_index()
-        )
-
-        # Calculate rates
-        df_weekly['late_rate'] = (
-            df_weekly['late_deliveries'] / df_weekly['total_orders'] * 100)
-        df_weekly['cancel_rate'] = (
-            df_weekly['canceled'] / df_weekly['total_orders'] * 100)
+        df_weekly = weekly_delivery_rates(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure()
 
@@ -890,10 +1539,7 @@ class Chart(Data):
         ))
 
         fig.update_layout(
-            title={'text': "Late Delivery & Cancellation Rate Trends (Weekly",
-                   'font': {'size': 24, 'color': 'white' if st.get_option(
-                       "theme.base") != "dark" else "#2d3748"}
-                   },
+            title=self.title_dict("Late Delivery & Cancellation Rate Trends (Weekly"),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             xaxis_title="Date",
@@ -906,28 +1552,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_state_delivery_map(self):
-        state_delivery = (
-            self.filtered_df
-            .groupby('customer_state')
-            .agg(
-                total_orders=('customer_state', 'size'),
-                on_time=('delivery_status',
-                         lambda x: (x == 'Shipping on time').sum()),
-                late=('delivery_status',
-                      lambda x: (x == 'Late delivery').sum())
-            )
-            .reset_index()
-        )
-
-        state_delivery['on_time_rate'] = (
-            state_delivery['on_time'] / state_delivery['total_orders'] * 100)
-
-        state_delivery['state_code'] = (
-            state_delivery['customer_state']
-            .str.strip()
-            .map(US_STATE_ABBREV)
-        )
+        state_delivery = state_totals(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(data=go.Choropleth(
             locations=state_delivery['state_code'],
@@ -945,27 +1573,17 @@ class Chart(Data):
         ))
 
         fig.update_layout(
-            title={
-                'text': 'On-Time Delivery Rate by State',
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict('On-Time Delivery Rate by State'),
             geo_scope='usa',
             height=500
         )
 
         return fig
 
+    @memoize_figure
     def create_revenue_by_segment_funnel(self):
-        segment_data = self.filtered_df.groupby('customer_segment').agg({
-            'sales_per_order': 'sum',
-            'order_id': 'count'
-        }).reset_index()
-        segment_data['aov'] = segment_data['sales_per_order'] / \
-            segment_data['order_id']
-
-        segment_data = segment_data.sort_values(
-            'sales_per_order', ascending=False)
+        segment_data = segment_totals(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(go.Funnel(
             y=segment_data['customer_segment'],
@@ -980,24 +1598,16 @@ class Chart(Data):
         ))
 
         fig.update_layout(
-            title={
-                'text': "Revenue by Customer Segment",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Revenue by Customer Segment"),
             height=400
         )
 
         return fig
 
+    @memoize_figure
     def create_top_cities_chart(self):
-        city_sales = self.filtered_df.groupby(['customer_city', 'customer_state', 'customer_region'])[
-            'sales_per_order'].sum().reset_index()
-        top_cities = city_sales.nlargest(20, 'sales_per_order').sort_values(
-            'sales_per_order', ascending=True)
-
-        top_cities['city_state'] = top_cities['customer_city'] + \
-            ', ' + top_cities['customer_state']
+        top_cities = top_cities_by_revenue(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = px.bar(
             top_cities,
@@ -1015,11 +1625,7 @@ class Chart(Data):
             hovertemplate='%{y}<br>Revenue: $%{x:,.0f}<extra></extra>')
 
         fig.update_layout(
-            title={
-                'text': "Top 20 Cities by Revenue",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Top 20 Cities by Revenue"),
             height=600,
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
                         )
@@ -1027,32 +1633,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_regional_radar_chart(self):
-        region_metrics = (
-            self.filtered_df
-            .groupby('customer_region')
-            .agg(
-                revenue=('sales_per_order', 'sum'),
-                profit=('profit_per_order', 'sum'),
-                orders=('sales_per_order', 'size'),
-                on_time=('delivery_status', lambda x: (
-                    x == 'Shipping on time').sum())
-            )
-            .reset_index()
-        )
-
-        region_metrics['aov'] = region_metrics['revenue'] / \
-            region_metrics['orders']
-        region_metrics['on_time_pct'] = (
-            region_metrics['on_time'] / region_metrics['orders'] * 100
-        )
-
-        # Normalize each metric to 0-100 scale
-        for col in ['revenue', 'profit', 'orders', 'aov', 'on_time_pct']:
-            max_val = region_metrics[col].max()
-            if max_val > 0:
-                region_metrics[f'{col}_norm'] = (
-                    region_metrics[col] / max_val * 100)
+        region_metrics = regional_metrics(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         categories = ['Revenue', 'Profit', 'Orders',
                       'Avg Order Value', 'On-Time Delivery']
@@ -1061,19 +1645,11 @@ class Chart(Data):
 
         colors = ['#13957b', '#ff7f0e', '#2ca02c', '#d62728']
 
-        for idx, region in enumerate(region_metrics['customer_region']):
-            values = [
-                region_metrics.loc[region_metrics['customer_region']
-                                   == region, 'revenue_norm'].values[0],
-                region_metrics.loc[region_metrics['customer_region']
-                                   == region, 'profit_norm'].values[0],
-                region_metrics.loc[region_metrics['customer_region']
-                                   == region, 'orders_norm'].values[0],
-                region_metrics.loc[region_metrics['customer_region']
-                                   == region, 'aov_norm'].values[0],
-                region_metrics.loc[region_metrics['customer_region']
-                                   == region, 'on_time_pct_norm'].values[0]
-            ]
+        # one row per region, read positionally instead of masking per metric
+        norm_values = region_metrics[['revenue_norm', 'profit_norm', 'orders_norm',
+                                      'aov_norm', 'on_time_pct_norm']].to_numpy()
+
+        for idx, (region, values) in enumerate(zip(region_metrics['customer_region'], norm_values)):
 
             fig.add_trace(go.Scatterpolar(
                 r=values,
@@ -1088,8 +1664,7 @@ class Chart(Data):
                 radialaxis=dict(visible=True, range=[0, 100],
                                 )
             ),
-            title={'text': "Regional Performance Comparison (Normalized Metrics)", 'font': {'size': 24, 'color': 'white' if st.get_option(
-                "theme.base") != "dark" else "#2d3748"}},
+            title=self.title_dict("Regional Performance Comparison (Normalized Metrics)"),
             height=500,
             showlegend=True,
             legend=dict(orientation="h", yanchor="bottom",
@@ -1098,9 +1673,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_segment_category_preference_chart(self):
-        segment_category = self.filtered_df.groupby(['customer_segment', 'category_name'])[
-            'sales_per_order'].sum().reset_index()
+        segment_category = segment_category_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = px.bar(
             segment_category,
@@ -1117,11 +1693,7 @@ class Chart(Data):
             hovertemplate='%{x}<br>%{data.name}<br>Revenue: $%{y:,.0f}<extra></extra>')
 
         fig.update_layout(
-            title={
-                'text': "Category Preference by Customer Segment",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Category Preference by Customer Segment"),
             height=400,
             legend=dict(orientation="h", yanchor="bottom",
                         y=1.02, xanchor="right", x=1)
@@ -1129,18 +1701,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_state_revenue_map(self):
-        state_revenue = self.filtered_df.groupby('customer_state').agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum',
-            'order_id': 'count'
-        }).reset_index()
-
-        state_revenue['state_code'] = (
-            state_revenue['customer_state']
-            .str.strip()
-            .map(US_STATE_ABBREV)
-        )
+        state_revenue = state_totals(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(data=go.Choropleth(
             locations=state_revenue['state_code'],
@@ -1151,31 +1715,23 @@ class Chart(Data):
             marker_line_color='white',
             customdata=np.column_stack((
                 state_revenue['profit_per_order'],
-                state_revenue['order_id']
+                state_revenue['total_orders']
             )),
             hovertemplate='<b>%{location}</b><br>Revenue: $%{z:,.0f}<br>Profit: $%{customdata[0]:,.0f}<br>Orders: %{customdata[1]:,}<extra></extra>'
         ))
 
         fig.update_layout(
-            title={
-                'text': 'Revenue by State',
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict('Revenue by State'),
             geo_scope='usa',
             height=500
         )
 
         return fig
 
+    @memoize_figure
     def create_pareto_chart(self):
-        state_revenue = self.filtered_df.groupby('customer_state')[
-            'sales_per_order'].sum().sort_values(ascending=False).reset_index()
-
-        state_revenue['cumulative_revenue'] = state_revenue['sales_per_order'].cumsum()
-        total_revenue = state_revenue['sales_per_order'].sum()
-        state_revenue['cumulative_pct'] = (
-            state_revenue['cumulative_revenue'] / total_revenue * 100)
+        state_revenue = state_revenue_pareto(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = make_subplots(specs=[[{"secondary_y": True}]])
 
@@ -1214,10 +1770,7 @@ class Chart(Data):
         )
 
         fig.update_layout(
-            title={'text': "Revenue Pareto Chart (80/20 Analysis by State",
-                   'font': {'size': 24, 'color': 'white' if st.get_option(
-                       "theme.base") != "dark" else "#2d3748"}
-                   },
+            title=self.title_dict("Revenue Pareto Chart (80/20 Analysis by State"),
             hovermode='x unified',
             height=500,
             showlegend=True,
@@ -1230,15 +1783,11 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_product_matrix_chart(self):
 
-        product_data = self.filtered_df.groupby(['product_name', 'category_name']).agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum',
-            'order_id': 'count'
-        }).reset_index()
-
-        product_data = product_data.nlargest(100, 'sales_per_order')
+        product_data = top_product_performance(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         avg_revenue = product_data['sales_per_order'].median()
         avg_profit = product_data['profit_per_order'].median()
@@ -1279,11 +1828,7 @@ class Chart(Data):
         ]
 
         fig.update_layout(
-            title={
-                'text': "Product Performance Matrix (Top 100 Products)",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Product Performance Matrix (Top 100 Products)"),
             annotations=annotations,
             height=600,
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
@@ -1292,16 +1837,14 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_top_quantity_products_chart(self):
-        product_qty = self.filtered_df.groupby(['product_name', 'category_name'])[
-            'order_quantity'].sum().reset_index()
-        top_products = product_qty.nlargest(20, 'order_quantity').sort_values(
-            'order_quantity', ascending=True)
+        top_products = top_products_by_quantity(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         # Truncate names
-        top_products['product_name_short'] = top_products['product_name'].apply(
-            lambda x: x[:50] + '...' if len(x) > 50 else x
-        )
+        top_products['product_name_short'] = truncate_labels(
+            top_products['product_name'], 50)
 
         fig = px.bar(
             top_products,
@@ -1317,11 +1860,7 @@ class Chart(Data):
         fig.update_traces(hovertemplate='%{y}<br>Units: %{x:,}<extra></extra>')
 
         fig.update_layout(
-            title={
-                'text': "Top 20 Products by Units Sold",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Top 20 Products by Units Sold"),
             height=600,
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
                         )
@@ -1329,26 +1868,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_category_sunburst_chart(self):
-        product_data = self.filtered_df.groupby(['category_name', 'product_name']).agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum'
-        }).reset_index()
-
-        product_data['profit_margin'] = (
-            product_data['profit_per_order'] / product_data['sales_per_order'] * 100)
-
-        top_products = product_data.groupby('category_name').apply(
-            lambda x: x.nlargest(5, 'sales_per_order')
-        ).reset_index(level=0)
-
-        category_totals = self.filtered_df.groupby('category_name').agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum'
-        }).reset_index()
-        category_totals['profit_margin'] = (
-            category_totals['profit_per_order'] / category_totals['sales_per_order'] * 100)
-        category_totals['product_name'] = ''
+        top_products, category_totals = category_top_products(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         labels = ['All Categories'] + category_totals['category_name'].tolist() + \
             top_products['product_name'].tolist()
@@ -1371,26 +1894,19 @@ class Chart(Data):
         ))
 
         fig.update_layout(
-            title={'text': "Product Category Deep Dive (Top 5 Products per Category",
-                   'font': {'size': 24, 'color': 'white' if st.get_option(
-                       "theme.base") != "dark" else "#2d3748"}
-                   },
+            title=self.title_dict("Product Category Deep Dive (Top 5 Products per Category"),
             height=600
         )
 
         return fig
 
+    @memoize_figure
     def create_product_trend_chart(self, selected_products=None):
-        if selected_products is None:
-            top_products = self.filtered_df.groupby(
-                'product_name')['sales_per_order'].sum().nlargest(5).index.tolist()
-            selected_products = top_products
-
-        df_filtered = self.filtered_df[self.filtered_df['product_name'].isin(
-            selected_products)]
-
-        df_monthly = df_filtered.groupby([pd.Grouper(key='order_date', freq='ME'), 'product_name'])[
-            'sales_per_order'].sum().reset_index()
+        # tuple so the selection is hashable as part of the cache key
+        if selected_products is not None:
+            selected_products = tuple(selected_products)
+        df_monthly = product_monthly_sales(
+            self.filtered_df, self.csv_file, self.filter_key, selected_products)
 
         fig = px.line(
             df_monthly,
@@ -1404,11 +1920,7 @@ class Chart(Data):
         fig.update_traces(mode='lines+markers', hovertemplate='%{y:$,.0f}')
 
         fig.update_layout(
-            title={
-                'text': "Product Performance Over Time (Top 5 Products)",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Product Performance Over Time (Top 5 Products)"),
             height=400,
             hovermode='x unified',
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
@@ -1417,22 +1929,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_low_performers_table(self):
-        product_data = self.filtered_df.groupby(['product_name', 'category_name']).agg({
-            'order_id': 'count',
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum'
-        }).reset_index()
-
-        product_data['profit_margin'] = (
-            product_data['profit_per_order'] / product_data['sales_per_order'] * 100)
-        low_performers = product_data[
-            (product_data['profit_per_order'] < 0) |
-            (product_data['sales_per_order'] <
-             product_data['sales_per_order'].quantile(0.1))
-        ].sort_values('profit_per_order')
-
-        low_performers = low_performers.head(20)
+        low_performers = low_performing_products(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(data=[go.Table(
             header=dict(
@@ -1444,45 +1944,36 @@ class Chart(Data):
             ),
             cells=dict(
                 values=[
-                    low_performers['product_name'].apply(
-                        lambda x: x[:40] + '...' if len(x) > 40 else x),
+                    truncate_labels(low_performers['product_name'], 40),
                     low_performers['category_name'],
                     low_performers['order_id'],
-                    low_performers['sales_per_order'].apply(
-                        lambda x: f'${x:,.0f}'),
-                    low_performers['profit_per_order'].apply(
-                        lambda x: f'${x:,.0f}'),
-                    low_performers['profit_margin'].apply(
-                        lambda x: f'{x:.1f}%')
+                    format_currency(low_performers['sales_per_order']),
+                    format_currency(low_performers['profit_per_order']),
+                    np.char.mod('%.1f%%', low_performers['profit_margin'].to_numpy())
                 ],
                 fill_color=[['white', '#f0f0f0'] * len(low_performers)],
                 font=dict(color=[
                     'black', 'black', 'black', 'black',
-                    ['red' if x < 0 else 'black' for x in low_performers['profit_per_order']],
-                    ['red' if x < 0 else 'black' for x in low_performers['profit_margin']]
+                    np.where(low_performers['profit_per_order'].to_numpy()
+                             < 0, 'red', 'black').tolist(),
+                    np.where(low_performers['profit_margin'].to_numpy()
+                             < 0, 'red', 'black').tolist()
                 ]),
                 align='left'
             )
         )])
 
         fig.update_layout(
-            title={'text': "Low Performing Products (Negative Profit or Bottom 10% Sales",
-                   'font': {'size': 24, 'color': 'white' if st.get_option(
-                       "theme.base") != "dark" else "#2d3748"}
-                   },
+            title=self.title_dict("Low Performing Products (Negative Profit or Bottom 10% Sales"),
             height=500
         )
 
         return fig
 
+    @memoize_figure
     def create_daily_sales_chart(self):
-        df_daily = self.filtered_df.groupby(
-            'order_date')['sales_per_order'].sum().reset_index()
-
-        df_daily['ma_7'] = df_daily['sales_per_order'].rolling(
-            window=7, min_periods=1).mean()
-        df_daily['ma_30'] = df_daily['sales_per_order'].rolling(
-            window=30, min_periods=1).mean()
+        df_daily = daily_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure()
 
@@ -1511,11 +2002,7 @@ class Chart(Data):
         ))
 
         fig.update_layout(
-            title={
-                'text': "Daily Sales Pattern with Moving Averages",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Daily Sales Pattern with Moving Averages"),
             xaxis_title="Date",
             yaxis_title="Revenue ($)",
             hovermode='x unified',
@@ -1541,14 +2028,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_monthly_revenue_profit_chart(self):
-        df_monthly = self.filtered_df.groupby(pd.Grouper(key='order_date', freq='ME')).agg({
-            'sales_per_order': 'sum',
-            'profit_per_order': 'sum'
-        }).reset_index()
-
-        df_monthly['profit_margin'] = (
-            df_monthly['profit_per_order'] / df_monthly['sales_per_order'] * 100)
+        df_monthly = monthly_totals(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         fig.add_trace(
@@ -1587,11 +2070,7 @@ class Chart(Data):
         )
 
         fig.update_layout(
-            title={
-                'text': "Monthly Revenue, Profit & Margin",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Monthly Revenue, Profit & Margin"),
             hovermode='x unified',
             height=400,
             barmode='group',
@@ -1604,15 +2083,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_day_of_week_chart(self):
-        df_copy = self.filtered_df.copy()
-        df_copy['day_of_week'] = df_copy['order_date'].dt.day_name()
-        df_copy['day_num'] = df_copy['order_date'].dt.dayofweek
-
-        # Aggregate by day of week
-        dow_sales = df_copy.groupby(['day_num', 'day_of_week'])[
-            'sales_per_order'].mean().reset_index()
-        dow_sales = dow_sales.sort_values('day_num')
+        dow_sales = day_of_week_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(go.Bar(
             x=dow_sales['day_of_week'],
@@ -1622,17 +2096,13 @@ class Chart(Data):
                 colorscale='Blues',
                 showscale=False
             ),
-            text=dow_sales['sales_per_order'].apply(lambda x: f'${x:,.0f}'),
+            text=format_currency(dow_sales['sales_per_order']),
             textposition='auto',
             hovertemplate='%{x}<br>Avg Revenue: $%{y:,.0f}<extra></extra>'
         ))
 
         fig.update_layout(
-            title={
-                'text': "Average Revenue by Day of Week",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Average Revenue by Day of Week"),
             xaxis_title="Day of Week",
             yaxis_title="Average Revenue ($)",
             height=400
@@ -1640,36 +2110,22 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_weekly_heatmap(self):
-        df_copy = self.filtered_df.copy()
-        df_copy['week'] = df_copy['order_date'].dt.isocalendar().week
-        df_copy['day_of_week'] = df_copy['order_date'].dt.day_name()
-
-        heatmap_data = df_copy.groupby(['day_of_week', 'week'])[
-            'sales_per_order'].sum().reset_index()
-
-        heatmap_pivot = heatmap_data.pivot(
-            index='day_of_week', columns='week', values='sales_per_order')
-
-        days_order = ['Monday', 'Tuesday', 'Wednesday',
-                      'Thursday', 'Friday', 'Saturday', 'Sunday']
-        heatmap_pivot = heatmap_pivot.reindex(days_order)
+        heatmap_pivot = weekly_heatmap(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = go.Figure(data=go.Heatmap(
-            z=heatmap_pivot.values,
-            x=heatmap_pivot.columns,
-            y=heatmap_pivot.index,
+            z=np.ascontiguousarray(heatmap_pivot.to_numpy(dtype='float32')),
+            x=heatmap_pivot.columns.to_numpy(),
+            y=heatmap_pivot.index.to_numpy(),
             colorscale='Blues',
             hovertemplate='Week %{x}, %{y}<br>Revenue: $%{z:,.0f}<extra></extra>',
             colorbar=dict(title="Revenue ($)")
         ))
 
         fig.update_layout(
-            title={
-                'text': "Weekly Sales Heatmap: Week Number vs Day of Week",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Weekly Sales Heatmap: Week Number vs Day of Week"),
             xaxis_title="Week Number",
             yaxis_title="Day of Week",
             height=400
@@ -1677,16 +2133,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_quarterly_analysis_chart(self):
-        df_copy = self.filtered_df.copy()
-        df_copy['quarter'] = df_copy['order_date'].dt.quarter
-        df_copy['month'] = df_copy['order_date'].dt.month
-
-        # Aggregate by quarter and month
-        quarterly_data = df_copy.groupby(['quarter', 'month'])[
-            'sales_per_order'].sum().reset_index()
-        quarterly_data['quarter_label'] = 'Q' + \
-            quarterly_data['quarter'].astype(str)
+        quarterly_data = quarterly_sales(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = px.line(
             quarterly_data,
@@ -1699,11 +2149,7 @@ class Chart(Data):
         )
 
         fig.update_layout(
-            title={
-                'text': "Quarterly Revenue Comparison",
-                'font': {'size': 24, 'color': 'white' if st.get_option(
-                    "theme.base") != "dark" else "#2d3748"}
-            },
+            title=self.title_dict("Quarterly Revenue Comparison"),
             height=400,
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
                         )
@@ -1711,16 +2157,10 @@ class Chart(Data):
 
         return fig
 
+    @memoize_figure
     def create_trend_decomposition_chart(self):
-        df_weekly = self.filtered_df.groupby(pd.Grouper(key='order_date', freq='W'))[
-            'sales_per_order'].sum().reset_index()
-
-        df_weekly['trend'] = df_weekly['sales_per_order'].rolling(
-            window=4, center=True, min_periods=1).mean()
-        df_weekly['seasonal'] = df_weekly['sales_per_order'] - \
-            df_weekly['trend']
-        df_weekly['residual'] = df_weekly['sales_per_order'] - \
-            df_weekly['trend'] - df_weekly['seasonal']
+        df_weekly = weekly_decomposition(
+            self.filtered_df, self.csv_file, self.filter_key)
 
         fig = make_subplots(
             rows=4, cols=1,
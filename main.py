@@ -1,3 +1,12 @@
+# on machines with cuDF, run pandas through its GPU accelerator; anything it
+# does not cover falls back to the CPU. it has to be installed before
+# anything imports pandas
+try:
+    import cudf.pandas
+    cudf.pandas.install()
+except ImportError:
+    pass
+
 import streamlit as st
 from components import Chart
 
@@ -31,16 +40,6 @@ st.markdown(
             padding-top: 2rem;
         }
         
-        /* Tab styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            padding: 10px 20px;
-            font-weight: 500;
-        }
-        
         /* Primary color customization */
         :root {
             --primary-color: #13957b;
@@ -56,57 +55,69 @@ c = Chart('data/ecommerce_sales_data.csv')
 with st.sidebar:
     st.header("🔍 Filters")
 
-    st.subheader("Date Range")
-    min_date = c.df['order_date'].min()
-    max_date = c.df['order_date'].max()
+    # batch the filter edits so the dashboard reruns once per apply rather
+    # than once per widget change
+    with st.form("filters", border=False):
+        st.subheader("Date Range")
+        min_date = c.df['order_date'].min()
+        max_date = c.df['order_date'].max()
+
+        date_range = st.date_input(
+            "Select Date Range",
+            value=(min_date, max_date),
+            min_value=min_date,
+            max_value=max_date,
+            key='date_range'
+        )
 
-    date_range = st.sidebar.date_input(
-        "Select Date Range",
-        value=(min_date, max_date),
-        min_value=min_date,
-        max_value=max_date,
-        key='date_range'
-    )
+        # look each option list up once; it doubles as the default selection
+        region_options = c.unique_values('customer_region')
+        category_options = c.unique_values('category_name')
+        segment_options = c.unique_values('customer_segment')
+        status_options = c.unique_values('delivery_status')
+        shipping_options = c.unique_values('shipping_type')
+
+        st.subheader("Region")
+        regions = st.multiselect(
+            "Select Regions",
+            options=region_options,
+            default=region_options,
+            key='region_filter'
+        )
 
-    st.subheader("Region")
-    regions = st.multiselect(
-        "Select Regions",
-        options=c.unique_values('customer_region'),
-        default=c.unique_values('customer_region'),
-        key='region_filter'
-    )
+        st.subheader("Category")
+        categories = st.multiselect(
+            "Select Categories",
+            options=category_options,
+            default=category_options,
+            key='category_filter'
+        )
 
-    st.subheader("Category")
-    categories = st.multiselect(
-        "Select Categories",
-        options=c.unique_values('category_name'),
-        default=c.unique_values('category_name'),
-        key='category_filter'
-    )
+        st.subheader("Customer Segment")
+        segments = st.multiselect(
+            "Select Segments",
+            options=segment_options,
+            default=segment_options,
+            key='segment_filter'
+        )
 
-    st.subheader("Customer Segment")
-    segments = st.multiselect(
-        "Select Segments",
-        options=c.unique_values('customer_segment'),
-        default=c.unique_values('customer_segment'),
-        key='segment_filter'
-    )
+        st.subheader("Delivery Status")
+        delivery_status = st.multiselect(
+            "Select Status",
+            options=status_options,
+            default=status_options,
+            key='status_filter'
+        )
 
-    st.subheader("Delivery Status")
-    delivery_status = st.multiselect(
-        "Select Status",
-        options=c.unique_values('delivery_status'),
-        default=c.unique_values('delivery_status'),
-        key='status_filter'
-    )
+        st.subheader("Shipping Type")
+        shipping_types = st.multiselect(
+            "Select Shipping Types",
+            options=shipping_options,
+            default=shipping_options,
+            key='shipping_filter'
+        )
 
-    st.subheader("Shipping Type")
-    shipping_types = st.multiselect(
-        "Select Shipping Types",
-        options=c.unique_values('shipping_type'),
-        default=c.unique_values('shipping_type'),
-        key='shipping_filter'
-    )
+        st.form_submit_button("✅ Apply Filters", width='stretch')
 
     if st.button("🔄 Reset All Filters", width='stretch'):
         st.rerun()
@@ -167,7 +178,7 @@ with col4:
     )
 
 
-tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
+views = [
     "📊 Overview",
     "💼 Sales Analysis",
     "💰 Profitability",
@@ -175,11 +186,21 @@ tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
     "👥 Customer & Geographic",
     "📦 Product Performance",
     "📅 Time Series"
-])
+]
+
+# st.tabs runs every tab body on each rerun; a radio lets only the selected
+# view build its charts
+active_view = st.radio(
+    "View",
+    views,
+    horizontal=True,
+    label_visibility='collapsed',
+    key='active_view'
+)
 
-with tab1:
+if active_view == views[0]:
     st.header("Overview Dashboard")
-    st.caption("Main KPIs are displayed above the tabs and apply to all views")
+    st.caption("Main KPIs are displayed above the view selector and apply to all views")
 
     colA1, colA2 = st.columns([2, 1])
 
@@ -210,7 +231,7 @@ with tab1:
         )
 
 
-with tab2:
+if active_view == views[1]:
     st.header("Sales Analysis")
 
     st.plotly_chart(
@@ -242,7 +263,7 @@ with tab2:
         width='stretch',
     )
 
-with tab3:
+if active_view == views[2]:
     st.header("Profitability Analysis")
 
     # Row 1: Scatter plot
@@ -281,7 +302,7 @@ with tab3:
             width='stretch',
         )
 
-with tab4:
+if active_view == views[3]:
     st.header("Shipping & Delivery Performance")
 
     col1, col2 = st.columns([1, 1])
@@ -322,7 +343,7 @@ with tab4:
         width='stretch',
     )
 
-with tab5:
+if active_view == views[4]:
     st.header("Customer & Geographic Analysis")
 
     col1, col2 = st.columns([1, 1])
@@ -367,7 +388,7 @@ with tab5:
             width='stretch'
         )
 
-with tab6:
+if active_view == views[5]:
     st.header("Product Performance")
 
     st.plotly_chart(
@@ -399,7 +420,7 @@ with tab6:
         width='stretch',
     )
 
-with tab7:
+if active_view == views[6]:
     st.header("Time Series Analysis")
 
     st.plotly_chart(